@@ -1,19 +1,74 @@
 import abc
+import asyncio
+import codecs
+import collections
+import io
+import logging
 import os
+import random
+import re
+import shlex
+import sys
 import time
+from contextlib import asynccontextmanager
 from enum import Enum
 from io import StringIO, TextIOBase
-from typing import List, Optional, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import anyio.abc
 import asyncssh
 from prefect.blocks.core import SecretStr
 from prefect.infrastructure.base import Infrastructure, InfrastructureResult
-from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
+from prefect.utilities.asyncutils import sync_compatible
 from pydantic import Field
-from sshfs import SSHFileSystem
 from typing_extensions import Literal
 
+# Size of the chunks in which log files are read from the hpc system
+LOG_CHUNK_SIZE = 1 << 20
+
+# Maximum number of characters in a single log message, well below the size
+# accepted by the Prefect API log handler (1 MB by default)
+LOG_MESSAGE_SIZE = 1 << 17
+
+# Attempts and maximum backoff (seconds) for idempotent remote operations
+RETRY_ATTEMPTS = 5
+RETRY_MAX_BACKOFF = 16
+
+
+class SlurmCommandError(RuntimeError):
+
+    """
+    A slurm cli command failed on the hpc system, e.g. because slurmctld could
+    not be contacted
+    """
+
+
+# Errors caused by the network, the ssh connection or a temporarily unavailable
+# slurm controller rather than the operation itself
+TRANSIENT_ERRORS = (
+    SlurmCommandError,
+    asyncssh.DisconnectError,
+    asyncssh.ChannelOpenError,
+    asyncssh.SFTPConnectionLost,
+    asyncssh.SFTPNoConnection,
+    asyncio.TimeoutError,
+    OSError,
+)
+
+# Errors that persist on retries; retrying failed logins may lock the account
+PERMANENT_ERRORS = (asyncssh.PermissionDenied, asyncssh.HostKeyNotVerifiable)
+
+T = TypeVar("T")
+
 
 class SlurmJobStatus(Enum):
 
@@ -48,13 +103,33 @@ class SlurmBackend:
         """Submit a new SLURM Job to process a flow run"""
 
     @abc.abstractmethod
-    async def status(self, jobid: int, grace_seconds: int = 30) -> SlurmJobStatus:
+    async def status(
+        self, jobid: int, grace_seconds: int = 30, use_cache: bool = True
+    ) -> SlurmJobStatus:
         """Obtain the status of a SLURM job"""
 
     @abc.abstractmethod
     async def kill(self, jobid: int, grace_seconds: int = 30):
         """Cancel the job with jobid"""
 
+    async def kill_many(self, jobids: List[int], grace_seconds: int = 30):
+        """Cancel all jobs in jobids"""
+        for jobid in jobids:
+            await self.kill(jobid, grace_seconds)
+
+    async def accounting_status(
+        self, jobid: int, grace_seconds: int = 30
+    ) -> SlurmJobStatus:
+        """Obtain the final status of a job that has left the slurm queue"""
+        return SlurmJobStatus.UNDEFINED
+
+    @abc.abstractmethod
+    async def tail(self, path: str, write: Callable[[bytes], Any]):
+        """Pass the content of a file on the hpc system to write as it grows"""
+
+    async def aclose(self):
+        """Release any resources (e.g. connections) held by the backend"""
+
 
 class CLIBasedSlurmBackend(SlurmBackend):
 
@@ -68,16 +143,80 @@ class CLIBasedSlurmBackend(SlurmBackend):
                     commands sbatch, squeue, and scancel are available
     username (str)  The username to authenticate with the hpc system via ssh
     password (str)  The password to authenticate the user via ssh
+    status_ttl (float)  Seconds for which a job status is reused without
+                        querying slurm again
+    only_job_state (bool)   Query job states with 'squeue --only-job-state', which
+                            is answered from the job state cache of slurmctld
+                            (requires enable_job_state_cache, Slurm 24.05+)
+    logger (Logger)     Logger used to report retries of remote operations
     """
 
     host: str
     username: str
     password: str
-
-    def __init__(self, host: str, username: str, password: str):
+    status_ttl: float
+    only_job_state: bool
+
+    STATUS_CMD_TMPL = "squeue --jobs=%s --Format=JobID,State,exit_code --noheader"
+    STATUS_CMD_TMPL_CACHED = STATUS_CMD_TMPL + " --only-job-state"
+
+    # Slurm job states as reported by squeue; other states map to UNKNOWN
+    _STATUS_MAP = {
+        "PENDING": SlurmJobStatus.PENDING,
+        "COMPLETED": SlurmJobStatus.COMPLETED,
+        "PREEMPTED": SlurmJobStatus.PREEMPTED,
+        "FAILED": SlurmJobStatus.FAILED,
+        "RUNNING": SlurmJobStatus.RUNNING,
+    }
+
+    # Final slurm job states as reported by sacct; other (non-final) states such
+    # as RUNNING, COMPLETING or REQUEUED map to UNKNOWN
+    _ACCOUNTING_MAP = {
+        "COMPLETED": SlurmJobStatus.COMPLETED,
+        "FAILED": SlurmJobStatus.FAILED,
+        "CANCELLED": SlurmJobStatus.FAILED,
+        "TIMEOUT": SlurmJobStatus.FAILED,
+        "NODE_FAIL": SlurmJobStatus.FAILED,
+        "OUT_OF_MEMORY": SlurmJobStatus.FAILED,
+        "BOOT_FAIL": SlurmJobStatus.FAILED,
+        "DEADLINE": SlurmJobStatus.FAILED,
+        "SPECIAL_EXIT": SlurmJobStatus.FAILED,
+        "REVOKED": SlurmJobStatus.FAILED,
+        "PREEMPTED": SlurmJobStatus.PREEMPTED,
+    }
+
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        status_ttl: float = 10.0,
+        only_job_state: bool = False,
+        logger: Optional[logging.Logger] = None,
+    ):
         self.host = host
         self.username = username
         self.password = password
+        self.status_ttl = status_ttl
+        self.only_job_state = only_job_state
+        self.logger = logger or logging.getLogger(__name__)
+        # Resolved once, connections are (re)opened with it repeatedly
+        self._password_plain = (
+            password.get_secret_value()
+            if hasattr(password, "get_secret_value")
+            else password
+        )
+        self._status_cache: dict[int, Tuple[float, SlurmJobStatus]] = {}
+        self._accounting_cache: dict[int, SlurmJobStatus] = {}
+        self._conn: Optional[asyncssh.SSHClientConnection] = None
+        self._sftp: Optional[asyncssh.SFTPClient] = None
+        self._conn_lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        """
+        Represent the backend without revealing the password
+        """
+        return f"{type(self).__name__}(host={self.host!r}, username={self.username!r})"
 
     async def submit(
         self,
@@ -108,46 +247,164 @@ class CLIBasedSlurmBackend(SlurmBackend):
         :grace_seconds: timeout for executing sbatch on the hpc system
         """
 
+        await self.kill_many([jobid], grace_seconds)
+
+    async def kill_many(self, jobids: List[int], grace_seconds: int = 30):
+        """
+        Cancel several slurm jobs with a single 'scancel' cli command
+
+        :jobids: the jobids that reference the jobs in slurm
+        :grace_seconds: timeout for executing scancel on the hpc system
+        """
+        if not jobids:
+            return
+
         await self._run_remote_command(
-            cmd=self._kill_command(jobid),
+            cmd=self._kill_command(jobids),
             grace_seconds=grace_seconds,
+            safe=True,
         )
+        for jobid in jobids:
+            self.invalidate(jobid)
 
-    async def status(self, jobid: int, grace_seconds: int = 30) -> SlurmJobStatus:
+    async def status(
+        self, jobid: int, grace_seconds: int = 30, use_cache: bool = True
+    ) -> SlurmJobStatus:
         """
         Obtain the status of a slurm job using the 'squeue' cli command
 
+        Concurrent requests for jobs on the same cluster are answered by a single
+        squeue call (see SqueuePoller). Results are reused for status_ttl seconds.
+
         :jobid: the jobid that references the job in slurm
         :grace_seconds: timeout for executing squeue on the hpc system
+        :use_cache: if False, always query squeue (the result is still cached)
+        """
+
+        cached = self._status_cache.get(jobid)
+        if (
+            use_cache
+            and cached is not None
+            and (time.monotonic() - cached[0]) < self.status_ttl
+        ):
+            return cached[1]
+
+        # The status may be as old as the request, not as the answer
+        requested = time.monotonic()
+        status = await SqueuePoller.instance(self).get(jobid, self, grace_seconds)
+        self._status_cache[jobid] = (requested, status)
+
+        return status
+
+    async def accounting_status(
+        self, jobid: int, grace_seconds: int = 30
+    ) -> SlurmJobStatus:
+        """
+        Obtain the final status of a slurm job using the 'sacct' cli command
+
+        Finished jobs are removed from the slurm queue, so squeue cannot tell
+        whether they completed or failed. Returns UNDEFINED if slurm accounting is
+        not available or has no record of the job, and UNKNOWN if accounting
+        reports a state that is not final (e.g. RUNNING or REQUEUED). Final states
+        are cached, as they do not change.
+
+        :jobid: the jobid that references the job in slurm
+        :grace_seconds: timeout for executing sacct on the hpc system
         """
 
+        status = self._accounting_cache.get(jobid)
+        if status is not None:
+            return status
+
         result = await self._run_remote_command(
-            cmd=self._status_command(jobid),
+            cmd=self._sacct_command(jobid),
             grace_seconds=grace_seconds,
+            safe=True,
         )
 
-        # Status command exits with non-zero exit code if jobid is not found.
-        # This includes finished jobs that have been removed from the queue!!!!
-        if result.exit_status != 0:
+        # sacct fails if accounting is disabled and prints nothing for unknown jobs
+        state = (result.stdout or "").split(maxsplit=1)
+        if result.exit_status != 0 or not state:
             return SlurmJobStatus.UNDEFINED
 
-        try:
-            status, exit_code = [v.strip() for v in result.stdout.split()[0:2]]
-
-            if status == "PENDING":
-                return SlurmJobStatus.PENDING
-            if status == "COMPLETED":
-                return SlurmJobStatus.COMPLETED
-            if status == "PREEMPTED":
-                return SlurmJobStatus.PREEMPTED
-            if status == "FAILED":
-                return SlurmJobStatus.FAILED
-            if status == "RUNNING":
-                return SlurmJobStatus.RUNNING
-
-            return SlurmJobStatus.UNKNOWN
-        except Exception:
-            return SlurmJobStatus.UNDEFINED
+        # States may carry details, e.g. "CANCELLED by 1000"
+        status = self._ACCOUNTING_MAP.get(state[0], SlurmJobStatus.UNKNOWN)
+        if status != SlurmJobStatus.UNKNOWN:
+            self._accounting_cache[jobid] = status
+
+        return status
+
+    def invalidate(self, jobid: int):
+        """
+        Forget the cached status of a slurm job
+
+        :jobid: the jobid that references the job in slurm
+        """
+        self._status_cache.pop(jobid, None)
+
+    async def status_many(
+        self, jobids: List[int], grace_seconds: int = 30
+    ) -> dict[int, SlurmJobStatus]:
+        """
+        Obtain the status of several slurm jobs with a single 'squeue' call
+
+        Jobs that are not found in the slurm queue are omitted from the result.
+
+        :jobids: the jobids that reference the jobs in slurm
+        :grace_seconds: timeout for executing squeue on the hpc system
+        """
+
+        cmd = self._status_command(jobids)
+
+        async def query(conn: asyncssh.SSHClientConnection) -> dict:
+            result = await conn.run(cmd, timeout=grace_seconds)
+
+            # Jobs are missing from the output if the jobid is not found.
+            # This includes finished jobs that have been removed from the queue!!!!
+            statuses = {}
+            for line in (result.stdout or "").splitlines():
+                try:
+                    jobid, status = line.split(maxsplit=2)[0:2]
+                except ValueError:
+                    continue
+
+                # Skip array and heterogeneous job steps such as 123_4 or 123+0
+                if jobid.isdigit():
+                    statuses[int(jobid)] = self._STATUS_MAP.get(
+                        status, SlurmJobStatus.UNKNOWN
+                    )
+
+            # squeue also exits non-zero if a single requested job is unknown,
+            # any other failure must not be mistaken for jobs leaving the queue
+            stderr = (result.stderr or "").strip()
+            unknown_job = "Invalid job id" in stderr
+            if result.exit_status != 0 and not statuses and not unknown_job:
+                raise SlurmCommandError(f"squeue failed: {stderr}")
+
+            return statuses
+
+        return await self.retry(query, cmd)
+
+    async def tail(self, path: str, write: Callable[[bytes], Any]):
+        """
+        Follow a file on the hpc system using the 'tail' cli command
+
+        The file is streamed as raw bytes in chunks from its beginning until the
+        coroutine is cancelled or the ssh channel closes. A file that does not
+        exist yet is picked up once created.
+
+        :path: the file to follow on the hpc system
+        :write: callable receiving the streamed content
+        """
+        c = await self._ensure_conn()
+        async with c.create_process(
+            self._tail_command(path), stderr=asyncssh.DEVNULL, encoding=None
+        ) as proc:
+            while True:
+                chunk = await proc.stdout.read(io.DEFAULT_BUFFER_SIZE)
+                if not chunk:
+                    break
+                write(chunk)
 
     async def _run_remote_command(
         self,
@@ -162,12 +419,137 @@ class CLIBasedSlurmBackend(SlurmBackend):
         :cmd: the command to be executed
         :in_stream: IO stream passed as stdin the the process on the hpc system
         :grace_seconds: timeout for executing squeue on the hpc system
+        :safe: the command is idempotent and retried on transient ssh errors
         """
-        result = None
-        async with self._get_connection() as c:
-            result = await c.run(cmd, stdin=in_stream, timeout=grace_seconds)
+        if safe:
+            return await self.retry(
+                lambda conn: conn.run(cmd, stdin=in_stream, timeout=grace_seconds),
+                cmd,
+            )
 
-        return result
+        return await self._run_remote_command_once(cmd, in_stream, grace_seconds)
+
+    async def _run_remote_command_once(
+        self, cmd: str, in_stream: TextIOBase = None, grace_seconds: int = 30
+    ) -> asyncssh.SSHCompletedProcess:
+        """
+        Run a shell command on the remote hpc system without retries
+
+        :cmd: the command to be executed
+        :in_stream: IO stream passed as stdin the the process on the hpc system
+        :grace_seconds: timeout for executing squeue on the hpc system
+        """
+        c = await self._ensure_conn()
+        try:
+            return await c.run(cmd, stdin=in_stream, timeout=grace_seconds)
+        except asyncssh.ChannelOpenError:
+            # The cached connection went stale (e.g. dropped by the login node)
+            # and the command never started, reconnect and try once more
+            self._discard_conn(c)
+            if in_stream is not None and in_stream.seekable():
+                in_stream.seek(0)
+            c = await self._ensure_conn()
+            return await c.run(cmd, stdin=in_stream, timeout=grace_seconds)
+
+    async def retry(
+        self,
+        operation: Callable[[asyncssh.SSHClientConnection], Awaitable[T]],
+        description: str,
+    ) -> T:
+        """
+        Run an idempotent remote operation, retrying on transient ssh errors
+
+        Up to RETRY_ATTEMPTS attempts are made with exponential backoff (1s up to
+        RETRY_MAX_BACKOFF) and jitter. Each attempt receives the cached connection.
+        If an attempt fails because of the connection, only that connection is
+        dropped, so that the next attempt reconnects. Commands that merely time
+        out are retried on the same connection. Authentication failures are
+        raised immediately.
+
+        :operation: callable returning a new awaitable for the given connection
+        :description: short description of the operation used in log messages
+        """
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            conn = None
+            try:
+                conn = await self._ensure_conn()
+                return await operation(conn)
+            except PERMANENT_ERRORS:
+                raise
+            except TRANSIENT_ERRORS as exc:
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+
+                # Slow or failing commands do not indicate a broken connection
+                # (asyncssh.TimeoutError is also an OSError, check it first)
+                if conn is not None and not isinstance(
+                    exc, (asyncio.TimeoutError, SlurmCommandError)
+                ):
+                    self._discard_conn(conn)
+
+                delay = min(RETRY_MAX_BACKOFF, 2 ** (attempt - 1))
+                delay += random.uniform(0, 1)
+                self.logger.warning(
+                    f"Slurm Job: {description!r} failed on host [{self.host}] "
+                    f"({exc!r}), retry {attempt}/{RETRY_ATTEMPTS - 1} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def aclose(self):
+        """
+        Close the cached connection to the slurm login node
+        """
+        async with self._conn_lock:
+            conn, self._conn = self._conn, None
+            self._sftp = None
+
+        if conn is not None:
+            conn.close()
+            await conn.wait_closed()
+
+    async def _ensure_conn(self) -> asyncssh.SSHClientConnection:
+        """
+        Return the cached connection to the slurm login node, opening it if needed
+
+        All remote commands share a single multiplexed ssh connection to avoid a
+        full TCP handshake, key exchange and authentication for every command.
+        """
+        async with self._conn_lock:
+            if self._conn is None:
+                self._conn = await self._get_connection()
+            return self._conn
+
+    async def sftp(
+        self, conn: Optional[asyncssh.SSHClientConnection] = None
+    ) -> asyncssh.SFTPClient:
+        """
+        Return an sftp session on the cached connection, starting it if needed
+
+        :conn: the connection to use, defaults to the cached connection
+        """
+        async with self._conn_lock:
+            if conn is None:
+                if self._conn is None:
+                    self._conn = await self._get_connection()
+                conn = self._conn
+
+            # Only the session of the current connection is cached
+            if conn is not self._conn:
+                return await conn.start_sftp_client()
+            if self._sftp is None:
+                self._sftp = await conn.start_sftp_client()
+            return self._sftp
+
+    def _discard_conn(self, conn: asyncssh.SSHClientConnection):
+        """
+        Drop a broken connection so that the next command reconnects
+
+        :conn: the connection that failed
+        """
+        if self._conn is conn:
+            self._conn = None
+            self._sftp = None
+        conn.close()
 
     def _submit_command(self, slurm_kwargs: dict[str, str]) -> str:
         """
@@ -177,30 +559,53 @@ class CLIBasedSlurmBackend(SlurmBackend):
         """
 
         # Create the arguments from slurm_kwargs
-        args = [
+        args = " ".join(
             f"--{k}" if v is None else f"--{k}={v}" for k, v in slurm_kwargs.items()
-        ]
-        cmd = " ".join(["sbatch", "--parsable"] + args)
+        )
 
-        return cmd
+        return f"sbatch --parsable {args}" if args else "sbatch --parsable"
 
-    def _kill_command(self, jobid: int) -> str:
+    def _kill_command(self, jobids: List[int]) -> str:
         """
-        Generates the kill command to terminate a slurm job
+        Generates the kill command to terminate slurm jobs
 
-        :jobid: the jobid that references the job in slurm
+        :jobids: the jobids that reference the jobs in slurm
+        """
+
+        return "scancel " + " ".join(str(int(jobid)) for jobid in jobids)
+
+    def _status_command(self, jobids: List[int]) -> str:
+        """
+        Generate the squeue command to monitor the status of several jobs
+
+        :jobids: the jobids that reference the jobs in slurm
         """
 
-        return f"scancel ${jobid}"
+        if self.only_job_state:
+            return self.STATUS_CMD_TMPL_CACHED % ",".join(map(str, jobids))
 
-    def _status_command(self, jobid) -> str:
+        return self.STATUS_CMD_TMPL % ",".join(map(str, jobids))
+
+    def _sacct_command(self, jobid: int) -> str:
         """
-        Generate the squeue command to monitor job status
+        Generate the sacct command to obtain the final state of a job
 
         :jobid: the jobid that references the job in slurm
         """
 
-        return f"squeue --job={jobid} --Format=State,exit_code --noheader"
+        return f"sacct -j {int(jobid)} -X -n -P -o State"
+
+    def _tail_command(self, path: str) -> str:
+        """
+        Generate the tail command to follow a file on the hpc system
+
+        tail runs in the background and is killed as soon as stdin is closed,
+        so that it does not outlive the ssh channel on the login node.
+
+        :path: the file to follow on the hpc system
+        """
+
+        return f"tail -n +1 -F {shlex.quote(path)} & cat > /dev/null; kill $!"
 
     def _get_connection(self) -> asyncssh.SSHClientConnection:
         """
@@ -211,12 +616,245 @@ class CLIBasedSlurmBackend(SlurmBackend):
             host=self.host,
             options=asyncssh.SSHClientConnectionOptions(
                 username=self.username,
-                password=self.password.get_secret_value(),
+                password=self._password_plain,
                 known_hosts=None,
+                # Keep the long-lived connection alive through NAT and firewalls
+                keepalive_interval=30,
+                keepalive_count_max=3,
             ),
         )
 
 
+class SqueuePoller:
+
+    """
+    Coalesces status requests for slurm jobs on the same cluster into a single
+    'squeue' call.
+
+    Each SlurmJob monitors its own slurm job. If many flow runs are monitored
+    from the same process, status requests arriving within a short time window
+    are answered by one 'squeue --jobs=id1,id2,...' call instead of one call per
+    job, which reduces the load on slurmctld and the number of ssh round-trips.
+
+    Parameters
+    ----------
+
+    coalesce_seconds (float)    Time window to collect requests for one squeue call
+    """
+
+    _instances: dict[Tuple[str, str], "SqueuePoller"] = {}
+
+    def __init__(self, coalesce_seconds: float = 1.0):
+        self.coalesce_seconds = coalesce_seconds
+        self._loop = asyncio.get_running_loop()
+        self._pending: dict[int, asyncio.Future] = {}
+        self._requests: dict[int, Tuple[CLIBasedSlurmBackend, int]] = {}
+        self._waiters: dict[asyncio.Future, int] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def instance(cls, backend: CLIBasedSlurmBackend) -> "SqueuePoller":
+        """
+        Return the poller shared by all backends connecting to the same cluster
+        as the same user
+
+        :backend: the backend requesting job states
+        """
+        key = (backend.host, backend.username)
+        poller = cls._instances.get(key)
+        if poller is None or poller._loop is not asyncio.get_running_loop():
+            poller = cls._instances[key] = cls()
+
+        return poller
+
+    async def get(
+        self, jobid: int, backend: CLIBasedSlurmBackend, grace_seconds: int = 30
+    ) -> SlurmJobStatus:
+        """
+        Obtain the status of a slurm job with the next batched squeue call
+
+        :jobid: the jobid that references the job in slurm
+        :backend: the backend used to run squeue on the hpc system
+        :grace_seconds: timeout for executing squeue on the hpc system
+        """
+        future = self._pending.get(jobid)
+        if future is None:
+            future = self._pending[jobid] = self._loop.create_future()
+            self._requests[jobid] = (backend, grace_seconds)
+
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._poll())
+        self._wakeup.set()
+
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            # Shielded, because the future may be shared by several callers
+            return await asyncio.shield(future)
+        finally:
+            self._waiters[future] -= 1
+            if not self._waiters[future]:
+                del self._waiters[future]
+                # Nobody waits for the job anymore (e.g. its flow run was
+                # cancelled), do not query it with the backend of that run
+                if self._pending.get(jobid) is future:
+                    del self._pending[jobid]
+                    del self._requests[jobid]
+                    future.cancel()
+
+    async def _poll(self):
+        """
+        Answer pending status requests until there are none left
+        """
+        while self._pending:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            # Give concurrent requests the chance to join this batch
+            await asyncio.sleep(self.coalesce_seconds)
+
+            batch, self._pending = self._pending, {}
+            requests, self._requests = self._requests, {}
+            if not batch:
+                continue
+
+            # Use the backend of a job still being monitored, so that the
+            # connection of a finished flow run is not reopened
+            backend = next(iter(requests.values()))[0]
+            grace_seconds = max(grace for _, grace in requests.values())
+
+            try:
+                statuses = await backend.status_many(list(batch), grace_seconds)
+            except Exception as exc:
+                for future in batch.values():
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for jobid, future in batch.items():
+                if not future.done():
+                    future.set_result(statuses.get(jobid, SlurmJobStatus.UNDEFINED))
+
+
+class SFTPFileSystem:
+
+    """
+    Filesystem of the slurm login node, accessed through the sftp subsystem of the
+    ssh connection shared with a CLIBasedSlurmBackend.
+
+    This avoids opening (and authenticating) a second ssh session just for
+    file operations.
+
+    Parameters
+    ----------
+
+    backend (CLIBasedSlurmBackend)  The backend providing the ssh connection
+    """
+
+    def __init__(self, backend: CLIBasedSlurmBackend):
+        self.backend = backend
+
+    async def mkdir(self, path: str):
+        """
+        Create a directory (and its parents) on the hpc system
+
+        :path: path of the directory on the hpc system
+        """
+
+        async def mkdir(conn: asyncssh.SSHClientConnection):
+            sftp = await self.backend.sftp(conn)
+            await sftp.makedirs(path, exist_ok=True)
+
+        await self.backend.retry(mkdir, f"mkdir {path}")
+
+    @asynccontextmanager
+    async def open(
+        self,
+        path: str,
+        mode: str = "r",
+        conn: Optional[asyncssh.SSHClientConnection] = None,
+    ) -> AsyncIterator[asyncssh.SFTPClientFile]:
+        """
+        Open a file on the hpc system
+
+        :path: path of the file on the hpc system
+        :mode: the file mode, reads text by default
+        :conn: the connection to use, defaults to the cached connection
+        """
+        sftp = await self.backend.sftp(conn)
+        async with sftp.open(path, mode) as stream:
+            yield stream
+
+    async def rmdir(self, path: str, recursive: bool = False):
+        """
+        Remove a directory on the hpc system
+
+        :path: path of the directory on the hpc system
+        :recursive: also remove the content of the directory if True
+        """
+
+        async def rmdir(conn: asyncssh.SSHClientConnection):
+            sftp = await self.backend.sftp(conn)
+            if recursive:
+                await sftp.rmtree(path)
+            else:
+                await sftp.rmdir(path)
+
+        await self.backend.retry(rmdir, f"rmdir {path}")
+
+
+class LogFollower:
+
+    """
+    Copies a log file of a running slurm job to stdout and keeps track of how
+    many bytes of it have been written, so that a stream that stopped (or was
+    stopped) can be completed from that offset.
+
+    Only complete lines are written, so that the lines of logs followed
+    concurrently (e.g. output and error) are not spliced into each other.
+
+    Parameters
+    ----------
+
+    path (str)      Path of the log file on the hpc system
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.offset = 0
+        # Decode incrementally, chunks may split multi-byte characters
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+
+    def write(self, chunk: bytes):
+        """
+        Write the complete lines of the next chunk of the log file to stdout
+
+        :chunk: raw content of the log file following the current offset
+        """
+        self.offset += len(chunk)
+        text = self._partial + self._decoder.decode(chunk)
+
+        # Progress bars end their line with a carriage return
+        end = max(text.rfind("\n"), text.rfind("\r")) + 1
+        # Keep an overlong line from growing without bound
+        if len(text) - end > LOG_CHUNK_SIZE:
+            end = len(text)
+
+        self._partial = text[end:]
+        if end:
+            sys.stdout.write(text[:end])
+            sys.stdout.flush()
+
+    def close(self):
+        """
+        Flush a trailing incomplete line
+        """
+        sys.stdout.write(self._partial + self._decoder.decode(b"", final=True))
+        sys.stdout.flush()
+        self._partial = ""
+
+
 class SlurmJobResult(InfrastructureResult):
     """Contains information about the final state of a completed Slurm Job"""
 
@@ -278,7 +916,9 @@ class SlurmJob(Infrastructure):
     stream_output: bool = Field(
         default=True,
         description="If set, output will be streamed from the job to "
-        "local standard output.",
+        "local standard output while it is running. The output of jobs that "
+        "finish before they are seen running is reported through the flow run "
+        "logger instead (the last max_log_lines lines of each log).",
     )
 
     conda_env: str = Field(
@@ -287,6 +927,42 @@ class SlurmJob(Infrastructure):
         "(must be pre-installed)",
     )
 
+    status_cache_seconds: float = Field(
+        default=10.0,
+        description="Seconds for which the status of the slurm job is reused "
+        "without querying the slurm workload manager again. Monitoring the job "
+        "always queries its current status.",
+    )
+
+    only_job_state: bool = Field(
+        default=False,
+        description="If set, job states are queried with 'squeue --only-job-state', "
+        "which is cheaper for slurmctld. Requires a Slurm installation with "
+        "enable_job_state_cache.",
+    )
+
+    max_log_lines: int = Field(
+        default=10000,
+        description="Maximum number of lines from the end of each slurm log "
+        "reported after the job has finished.",
+    )
+
+    min_polling_seconds: float = Field(
+        default=5,
+        description="Initial interval between polls of the slurm job status. "
+        "The interval doubles while the status does not change.",
+    )
+
+    max_polling_seconds: float = Field(
+        default=180,
+        description="Maximum interval between polls of the slurm job status.",
+    )
+
+    polling_jitter_seconds: float = Field(
+        default=5,
+        description="Maximum random delay added to each polling interval.",
+    )
+
     _backend_instance: SlurmBackend = None
 
     @property
@@ -304,7 +980,12 @@ class SlurmJob(Infrastructure):
                 f"{self.host} for user {self.username}"
             )
             self._backend_instance = CLIBasedSlurmBackend(
-                self.host, self.username, self.password
+                self.host,
+                self.username,
+                self.password,
+                status_ttl=self.status_cache_seconds,
+                only_job_state=self.only_job_state,
+                logger=self.logger,
             )
 
         return self._backend_instance
@@ -328,70 +1009,92 @@ class SlurmJob(Infrastructure):
         if not self.command:
             raise ValueError("Slurm job cannot be run with empty command.")
 
+        # The job environment is only built once and also provides the flow run id,
+        # falling back to the current environment without copying it
+        env = self._get_environment_variables(False)
+        flow_run_id = env.get("PREFECT__FLOW_RUN_ID") or os.environ.get(
+            "PREFECT__FLOW_RUN_ID"
+        )
+        if not flow_run_id:
+            raise ValueError("Slurm job cannot be run without PREFECT__FLOW_RUN_ID.")
+
         # Prepare working directory
-        flow_run_id = self._get_environment_variables()["PREFECT__FLOW_RUN_ID"]
         wdir = os.path.join(
             self.working_directory if self.working_directory else ".", flow_run_id
         )
 
-        # Manage garbage collection of fs to avoid long running sessions
-        fs = self._filesystem()
+        # File operations share the ssh connection of the backend, which is
+        # released after the run to avoid long running sessions
+        fs = self._filesystem
         try:
-            await run_sync_in_worker_thread(fs.mkdir, wdir)
-        finally:
-            del fs
-
-        self.logger.debug(
-            f"Slurm Job: created flow run dir [{wdir}] on host [{self.host}]"
-        )
-        self.slurm_kwargs["chdir"] = wdir
+            await fs.mkdir(wdir)
 
-        # Configure output files
-        self.slurm_kwargs["output"] = "output.log"
-        self.slurm_kwargs["error"] = "error.log"
+            self.logger.debug(
+                f"Slurm Job: created flow run dir [{wdir}] on host [{self.host}]"
+            )
+            self.slurm_kwargs["chdir"] = wdir
 
-        # Submit slurm job
-        jobid = await self._backend.submit(
-            self.slurm_kwargs, StringIO(self._submit_script())
-        )
-        pid = self._get_infrastructure_pid(jobid)
+            # Configure output files
+            self.slurm_kwargs["output"] = "output.log"
+            self.slurm_kwargs["error"] = "error.log"
 
-        if task_status is not None:
-            task_status.started(pid)
+            # Submit slurm job
+            jobid = await self._backend.submit(
+                self.slurm_kwargs, StringIO(self._submit_script(env))
+            )
+            pid = self._get_infrastructure_pid(jobid)
 
-        self.logger.info(f"Slurm Job: Job {jobid} submitted and registered as {pid}.")
+            if task_status is not None:
+                task_status.started(pid)
 
-        # Monitor the job until completion
-        status_code = await self._watch_job(self._backend, jobid)
+            self.logger.info(
+                f"Slurm Job: Job {jobid} submitted and registered as {pid}."
+            )
 
-        # Manage garbage collection of fs to avoid long running sessions
-        fs = self._filesystem()
-        try:
-            # Capture output
-            if self.stream_output:
-                try:
-                    with fs.open(
-                        os.path.join(wdir, self.slurm_kwargs["output"]), "r"
-                    ) as stream:
-                        print(stream.read())
-                    with fs.open(
-                        os.path.join(wdir, self.slurm_kwargs["error"]), "r"
-                    ) as stream:
-                        print(stream.read())
-                except Exception:
-                    self.logger.error("Could not retrieve logs from slurm job")
-
-            # Cleanup after run
+            # Monitor the job until completion, streaming its output while running
+            followers = [
+                LogFollower(os.path.join(wdir, self.slurm_kwargs[log]))
+                for log in ("output", "error")
+            ]
+            streaming = False
+            async with anyio.create_task_group() as tg:
+
+                def on_running():
+                    nonlocal streaming
+                    if self.stream_output and not streaming:
+                        streaming = True
+                        for follower in followers:
+                            tg.start_soon(self._stream_log, follower)
+
+                status_code = await self._watch_job(self._backend, jobid, on_running)
+
+                # Stop streaming, whatever tail has not delivered is read below
+                tg.cancel_scope.cancel()
+
+            # Complete the streamed logs from where tail stopped (this also
+            # covers streams that were interrupted while the job was running)
+            if streaming:
+                for follower in followers:
+                    await self._complete_log(fs, follower)
+
+            # Capture output of jobs that finished before they were seen running
+            if self.stream_output and not streaming:
+                paths = [
+                    os.path.join(wdir, self.slurm_kwargs[log])
+                    for log in ("output", "error")
+                ]
+                # Download the logs concurrently, but log them in order
+                logs = await asyncio.gather(*(self._fetch_log(fs, p) for p in paths))
+                for path, lines in zip(paths, logs):
+                    if lines is not None:
+                        self._log_lines(path, lines)
+
+            # Cleanup after run (only after the logs in wdir have been read)
             if not self.retain_working_directory:
-                try:
-                    fs.rmdir(wdir, recursive=True)
-                except Exception:
-                    self.logger.error(
-                        f"Slurm Job: could not delete working directory for "
-                        f"flow run [{flow_run_id}] on host [{self.host}]"
-                    )
+                await self._cleanup_wdir(fs, wdir, flow_run_id)
         finally:
-            del fs
+            # Release the ssh connection shared by the backend
+            await self._backend.aclose()
 
         return SlurmJobResult(identifier=pid, status_code=status_code)
 
@@ -411,22 +1114,61 @@ class SlurmJob(Infrastructure):
         :grace_seconds: timeout to complete the slurm job termination request
         """
         _, jobid = self._parse_infrastructure_pid(infrastructure_pid)
-        await self._backend.kill(jobid)
+        try:
+            await self._backend.kill(jobid)
+        finally:
+            await self._backend.aclose()
+
+    async def kill_many(self, infrastructure_pids: List[str], grace_seconds: int = 30):
+        """
+        Kill several flow runs.
 
-    def _submit_script(self) -> str:
+        All slurm jobs are cancelled with a single request to the slurm manager,
+        e.g. to cancel all outstanding jobs when shutting down a worker. Flow runs
+        on other clusters than host are skipped, as their job ids are unrelated.
+
+        :infrastructure_pids: identifiers for the infrastructure
+        :grace_seconds: timeout to complete the slurm job termination request
+        """
+        jobids = []
+        for infrastructure_pid in infrastructure_pids:
+            hostname, jobid = self._parse_infrastructure_pid(infrastructure_pid)
+            if hostname != self.host:
+                self.logger.warning(
+                    f"Slurm Job: Not killing {infrastructure_pid!r}, it does not "
+                    f"run on host [{self.host}]."
+                )
+                continue
+            jobids.append(jobid)
+
+        if jobids:
+            try:
+                await self._backend.kill_many(jobids, grace_seconds)
+            finally:
+                await self._backend.aclose()
+
+    def _submit_script(self, env: Optional[dict[str, str]] = None) -> str:
         """
         Generate the submit script for the slurm job
+
+        :env: environment variables exported in the script; obtained from
+              _get_environment_variables(False) if not given
         """
-        script = ["#!/bin/bash"]
-        script += [
-            f"export {k}={v}" for k, v in self._get_environment_variables(False).items()
-        ]
-        script += self.pre_run
+        if env is None:
+            env = self._get_environment_variables(False)
+
+        command = " ".join(self.command)
         if self.conda_env:
-            script += [f"conda run -n {self.conda_env} " + " ".join(self.command)]
-        else:
-            script += [" ".join(self.command)]
-        script += self.post_run
+            command = f"conda run -n {self.conda_env} {command}"
+
+        # Build all lines in one list and join once
+        script = [
+            "#!/bin/bash",
+            *(f"export {k}={v}" for k, v in env.items()),
+            *self.pre_run,
+            command,
+            *self.post_run,
+        ]
 
         return "\n".join(script)
 
@@ -450,39 +1192,204 @@ class SlurmJob(Infrastructure):
         hostname, pid = infrastructure_pid.split(":")
         return hostname, int(pid)
 
+    async def _fetch_log(
+        self, fs: SFTPFileSystem, path: str
+    ) -> Optional[collections.deque]:
+        """
+        Read the tail of a log file from the hpc system in chunks
+
+        Only the last max_log_lines lines are kept, so memory use is bounded
+        regardless of the log size. Returns None if the log cannot be retrieved.
+
+        :fs: the filesystem of the slurm login node
+        :path: path of the log file on the hpc system
+        """
+
+        async def read(conn: asyncssh.SSHClientConnection) -> collections.deque:
+            lines = collections.deque(maxlen=self.max_log_lines)
+            # Decode incrementally, chunks may split multi-byte characters
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            partial = ""
+
+            async with fs.open(path, "rb", conn) as stream:
+                while True:
+                    chunk = await stream.read(LOG_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    text = partial + decoder.decode(chunk)
+                    # A trailing carriage return may be the start of "\r\n"
+                    carry = "\r" if text.endswith("\r") else ""
+                    text = text[: len(text) - len(carry)]
+                    # Progress bars rewrite their line with carriage returns
+                    *complete, partial = re.split(r"\r\n|\r|\n", text)
+                    lines.extend(complete)
+                    # Keep an overlong line from growing without bound
+                    partial = (partial + carry)[-LOG_CHUNK_SIZE:]
+
+            partial += decoder.decode(b"", final=True)
+            partial = partial.rstrip("\r")
+            if partial:
+                lines.append(partial)
+
+            return lines
+
+        try:
+            # Reading is idempotent, restart from the beginning on ssh errors
+            return await fs.backend.retry(read, f"read {path}")
+        except Exception:
+            self.logger.error(f"Could not retrieve log [{path}] from slurm job")
+            return None
+
+    def _log_lines(self, path: str, lines: collections.deque):
+        """
+        Report the lines of a log file through the logger
+
+        The lines are split into messages of at most LOG_MESSAGE_SIZE characters,
+        so that they are not rejected by the Prefect API; longer lines are cut to
+        their last LOG_MESSAGE_SIZE characters.
+
+        :path: path of the log file on the hpc system
+        :lines: the lines of the log file
+        """
+        batch, size, first = [], 0, 1
+
+        def emit(last: int):
+            self.logger.info(
+                f"Slurm Job: last {len(lines)} lines of [{path}] "
+                f"({first}-{last}):\n" + "\n".join(batch)
+            )
+
+        for number, line in enumerate(lines, 1):
+            line = line[-LOG_MESSAGE_SIZE:]
+            if batch and size + len(line) > LOG_MESSAGE_SIZE:
+                emit(number - 1)
+                batch, size, first = [], 0, number
+            batch.append(line)
+            size += len(line) + 1
+
+        if batch:
+            emit(len(lines))
+
+    async def _cleanup_wdir(self, fs: SFTPFileSystem, wdir: str, flow_run_id: str):
+        """
+        Remove the working directory of a flow run from the hpc system
+
+        :fs: the filesystem of the slurm login node
+        :wdir: the working directory of the slurm job
+        :flow_run_id: the id of the flow run
+        """
+        try:
+            await fs.rmdir(wdir, recursive=True)
+        except Exception:
+            self.logger.error(
+                f"Slurm Job: could not delete working directory for "
+                f"flow run [{flow_run_id}] on host [{self.host}]"
+            )
+
+    async def _stream_log(self, follower: LogFollower):
+        """
+        Stream a log of a running slurm job to stdout
+
+        :follower: tracks the log file and the bytes streamed so far
+        """
+        try:
+            await self._backend.tail(follower.path, follower.write)
+        except Exception:
+            self.logger.warning(
+                f"Streaming [{follower.path}] from slurm job was interrupted, "
+                f"the remaining output is retrieved after the job has finished"
+            )
+
+    async def _complete_log(self, fs: SFTPFileSystem, follower: LogFollower):
+        """
+        Write the part of a log file that has not been streamed yet to stdout
+
+        :fs: the filesystem of the slurm login node
+        :follower: tracks the log file and the bytes streamed so far
+        """
+
+        async def read(conn: asyncssh.SSHClientConnection):
+            async with fs.open(follower.path, "rb", conn) as stream:
+                while True:
+                    chunk = await stream.read(LOG_CHUNK_SIZE, follower.offset)
+                    if not chunk:
+                        break
+                    follower.write(chunk)
+
+        try:
+            # Resumes at the current offset on ssh errors
+            await fs.backend.retry(read, f"read {follower.path}")
+        except Exception:
+            self.logger.error(
+                f"Could not retrieve log [{follower.path}] from slurm job"
+            )
+        finally:
+            follower.close()
+
     async def _watch_job(
-        self, backend: SlurmBackend, jobid: str, polling_seconds: int = 30
+        self,
+        backend: SlurmBackend,
+        jobid: str,
+        on_running: Optional[Callable[[], Any]] = None,
+        submission_grace_seconds: int = 30,
     ) -> int:
         """
         Monitor a running slurm job.
 
         The slurm work load manager is polled periodocally for the job status.
+        The polling interval starts at min_polling_seconds and doubles with every
+        poll that does not change the job status, up to max_polling_seconds. A
+        random jitter of up to polling_jitter_seconds avoids synchronised polling
+        of many jobs.
         The routine returns zero if the job has terminated with COMPLETED state or is
         not found in the slurm queue anymore. It returns -1 for FAILED jobs
         or UNDEFINED jobs.
 
-        Note that detecting failed slurm runs is fragile, because a failed job can
-        be removed from the slurm queue within the polling interval. In this case, the
-        routine returns zero indicating a normal termination.
+        A failed job can be removed from the slurm queue within the polling interval.
+        In this case, its final state is looked up in slurm accounting. If
+        accounting is not available, the routine returns zero indicating a normal
+        termination.
 
         :backend: the backend used to communicate with slurm
         :jobid: the id of the slurm job
-        :polling_seconds: polling interval for quering the slurm workload manager
+        :on_running: called whenever the job enters the RUNNING state
+        :submission_grace_seconds: time given to slurm to register a new job
         """
         completed = False
         submitted = False
+        attempt = 0
+        last_status = None
+        last_poll = None
+        interval = 0.0
 
         startWatching = time.time()
 
         while not completed:
 
-            status = await backend.status(jobid)
+            # Rate limit polling regardless of the branch taken below
+            if last_poll is not None:
+                await anyio.sleep(max(0, interval - (time.monotonic() - last_poll)))
+            last_poll = time.monotonic()
+
+            # Polling is rate limited already and must not see stale states
+            status = await backend.status(jobid, use_cache=False)
+
+            # Poll quickly again after a state change (e.g. PENDING -> RUNNING)
+            if status != last_status:
+                attempt = 0
+                last_status = status
+
+                if status == status.RUNNING and on_running is not None:
+                    on_running()
+
+            interval = self._polling_interval(attempt)
+            attempt += 1
 
             # Job never seen on the slurm queue
             if (status == status.UNDEFINED) and not submitted:
                 self.logger.error(f"Slurm Job: Job {jobid!r} not known to slurm.")
 
-                if (time.time() - startWatching) < polling_seconds:
+                if (time.time() - startWatching) < submission_grace_seconds:
                     # Just started watching, give the slurm agent some time
                     # to process the submission
                     continue
@@ -494,7 +1401,25 @@ class SlurmJob(Infrastructure):
             # to slurm in an interation
             submitted = True
 
-            # Job removed from slurm queue - assume it finished ok
+            # Job removed from slurm queue - ask slurm accounting how it ended
+            # and assume it finished ok if accounting has no record of it
+            if status == status.UNDEFINED:
+                final_status = await backend.accounting_status(jobid)
+                if final_status == status.UNKNOWN:
+                    # Accounting still sees the job queued or running (e.g. squeue
+                    # lost it temporarily), keep watching
+                    self.logger.debug(
+                        f"Slurm Job: Job {jobid!r} not in queue, but not finished "
+                        f"according to slurm accounting."
+                    )
+                    continue
+                if final_status not in (status.UNDEFINED, status.COMPLETED):
+                    self.logger.warn(
+                        f"Slurm Job: Job {jobid!r} ended with {final_status.name}."
+                    )
+                    completed = True
+                    return -1
+
             if (status == status.UNDEFINED) or (status == status.COMPLETED):
                 self.logger.info(f"Slurm Job: Job {jobid!r} finished/cleared.")
                 completed = True
@@ -505,11 +1430,21 @@ class SlurmJob(Infrastructure):
                 completed = True
                 return -1
 
-            await anyio.sleep(polling_seconds)
-
         # we should never reach this point!
         return -1
 
+    def _polling_interval(self, attempt: int) -> float:
+        """
+        Seconds to wait before the next status poll, using exponential backoff
+        with jitter
+
+        :attempt: number of polls since the job status last changed
+        """
+        # Bound the exponent, long running jobs are polled thousands of times
+        backoff = self.min_polling_seconds * 2 ** min(attempt, 32)
+        interval = min(self.max_polling_seconds, backoff)
+        return interval + random.uniform(0, self.polling_jitter_seconds)
+
     def _get_environment_variables(self, include_os_environ: bool = True):
         """
         Obtain environment variables to pass to the slurm job
@@ -524,12 +1459,10 @@ class SlurmJob(Infrastructure):
         # Drop null values allowing users to "unset" variables
         return {key: value for key, value in env.items() if value is not None}
 
-    def _filesystem(self) -> SSHFileSystem:
+    @property
+    def _filesystem(self) -> SFTPFileSystem:
         """
-        Return a connection to the slurm login node filesystem via ssh
+        Return the slurm login node filesystem, accessed through the ssh
+        connection of the backend
         """
-        return SSHFileSystem(
-            host=self.host,
-            username=self.username,
-            password=self.password.get_secret_value(),
-        )
+        return SFTPFileSystem(self._backend)
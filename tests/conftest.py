@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from prefect_slurm.slurm import CLIBasedSlurmBackend, SqueuePoller
+
+
+class FakeConnection:
+    """
+    Stands in for an asyncssh connection, answering commands in order with
+    (exit_status, stdout, stderr) tuples or raising the given exceptions
+    """
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.commands = []
+        self.closed = False
+
+    async def run(self, cmd, **kwargs):
+        self.commands.append(cmd)
+        result = self.results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        exit_status, stdout, stderr = result
+        return SimpleNamespace(exit_status=exit_status, stdout=stdout, stderr=stderr)
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """
+    Connections (or exceptions raised on connect) served to backends in order
+    """
+    queue = []
+
+    async def get_connection(self):
+        item = queue.pop(0)
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    monkeypatch.setattr(CLIBasedSlurmBackend, "_get_connection", get_connection)
+    return queue
+
+
+@pytest.fixture
+def backend(connections):
+    """
+    A backend connecting through the connections fixture
+    """
+    return CLIBasedSlurmBackend("cluster", "user", "secret")
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """
+    Retry immediately instead of waiting for the backoff
+    """
+    sleep = asyncio.sleep
+
+    async def no_sleep(delay, *args, **kwargs):
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+
+
+@pytest.fixture
+async def poller(monkeypatch):
+    """
+    The squeue poller used by the backend fixture, with a short batching window
+    """
+    poller = SqueuePoller(coalesce_seconds=0.01)
+    monkeypatch.setattr(SqueuePoller, "_instances", {("cluster", "user"): poller})
+    return poller
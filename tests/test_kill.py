@@ -0,0 +1,29 @@
+from conftest import FakeConnection
+
+from prefect_slurm import SlurmJob
+
+
+async def test_backend_kill_many_without_jobs(backend, connections):
+    await backend.kill_many([])
+
+    assert backend._conn is None
+
+
+async def test_kill_many_skips_jobs_on_other_clusters(connections):
+    job = SlurmJob(host="cluster", username="user", password="secret")
+    conn = FakeConnection((0, "", ""))
+    connections.append(conn)
+
+    await job.kill_many(["cluster:1", "other:2", "cluster:3"])
+
+    assert conn.commands == ["scancel 1 3"]
+    # The connection is not kept open after killing the jobs
+    assert conn.closed
+
+
+async def test_kill_many_without_jobs_on_this_cluster(connections):
+    job = SlurmJob(host="cluster", username="user", password="secret")
+
+    await job.kill_many(["other:2"])
+
+    assert job._backend._conn is None
@@ -0,0 +1,150 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from prefect_slurm import SlurmJob, slurm
+from prefect_slurm.slurm import LogFollower
+
+
+class FakeFile:
+    """
+    Serves the given chunks on subsequent reads
+    """
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    async def read(self, size=-1, offset=None):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+class FakeFileSystem:
+    """
+    Opens every path as a file serving the given chunks
+    """
+
+    def __init__(self, backend, *chunks):
+        self.backend = backend
+        self.chunks = chunks
+
+    @asynccontextmanager
+    async def open(self, path, mode="r", conn=None):
+        yield FakeFile(self.chunks)
+
+
+class FakeLogger:
+    """
+    Collects info messages
+    """
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    def info(self, message):
+        self.messages.append(message)
+
+
+@pytest.fixture
+def backend():
+    """
+    A backend running remote operations once without connecting
+    """
+
+    class Backend:
+        async def retry(self, operation, description):
+            return await operation(None)
+
+    return Backend()
+
+
+async def fetch(backend, *chunks, max_log_lines=100):
+    """
+    Fetch a log file consisting of the given chunks
+    """
+    job = SlurmJob(max_log_lines=max_log_lines)
+    lines = await job._fetch_log(FakeFileSystem(backend, *chunks), "slurm.out")
+    return list(lines)
+
+
+async def test_fetch_log_splits_lines_across_chunks(backend):
+    lines = await fetch(backend, b"first\nsec", b"ond\r", b"\nthird")
+
+    assert lines == ["first", "second", "third"]
+
+
+async def test_fetch_log_splits_progress_bars(backend):
+    lines = await fetch(backend, b"10%\r50%\r100%\r\ndone\n")
+
+    assert lines == ["10%", "50%", "100%", "done"]
+
+
+async def test_fetch_log_decodes_characters_split_across_chunks(backend):
+    data = "héllo\n".encode()
+
+    lines = await fetch(backend, data[:2], data[2:])
+
+    assert lines == ["héllo"]
+
+
+async def test_fetch_log_keeps_the_last_lines(backend):
+    lines = await fetch(backend, b"1\n2\n3\n4\n", max_log_lines=2)
+
+    assert lines == ["3", "4"]
+
+
+async def test_fetch_log_bounds_lines_without_newline(backend, monkeypatch):
+    monkeypatch.setattr(slurm, "LOG_CHUNK_SIZE", 4)
+
+    lines = await fetch(backend, *[b"x" * 4] * 10, b"yz\nend")
+
+    assert lines == ["xxxxyz", "end"]
+
+
+def test_log_lines_are_reported_in_bounded_messages(monkeypatch):
+    monkeypatch.setattr(slurm, "LOG_MESSAGE_SIZE", 10)
+    job = SlurmJob()
+    messages = []
+    monkeypatch.setattr(SlurmJob, "logger", property(lambda self: FakeLogger(messages)))
+
+    job._log_lines("slurm.out", ["abc", "def", "ghi", "x" * 20])
+
+    assert messages == [
+        "Slurm Job: last 4 lines of [slurm.out] (1-2):\nabc\ndef",
+        "Slurm Job: last 4 lines of [slurm.out] (3-3):\nghi",
+        "Slurm Job: last 4 lines of [slurm.out] (4-4):\n" + "x" * 10,
+    ]
+
+
+def test_log_followers_write_complete_lines(capsys):
+    output, error = LogFollower("slurm.out"), LogFollower("slurm.err")
+
+    output.write(b"out 1\nout")
+    error.write(b"err 1\ner")
+    output.write(b" 2\n")
+    error.write("r 2 \xe2\x9c".encode("latin-1"))
+    error.write(b"\x93")
+    output.close()
+    error.close()
+
+    assert capsys.readouterr().out == "out 1\nerr 1\nout 2\nerr 2 \u2713"
+    assert (output.offset, error.offset) == (12, 15)
+
+
+def test_log_follower_writes_progress_bars(capsys):
+    follower = LogFollower("slurm.out")
+
+    follower.write(b"10%\r50")
+    assert capsys.readouterr().out == "10%\r"
+
+    follower.write(b"%\r")
+    assert capsys.readouterr().out == "50%\r"
+
+
+def test_log_follower_bounds_lines_without_newline(capsys, monkeypatch):
+    monkeypatch.setattr(slurm, "LOG_CHUNK_SIZE", 4)
+    follower = LogFollower("slurm.out")
+
+    follower.write(b"xxx")
+    follower.write(b"xx")
+
+    assert capsys.readouterr().out == "xxxxx"
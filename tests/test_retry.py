@@ -0,0 +1,74 @@
+import asyncio
+
+import asyncssh
+import pytest
+from conftest import FakeConnection
+
+from prefect_slurm import slurm
+from prefect_slurm.slurm import SlurmCommandError
+
+OK = (0, "done\n", "")
+
+
+async def test_retry_reconnects_after_connection_loss(backend, connections, no_backoff):
+    broken = FakeConnection(asyncssh.ConnectionLost("reset by peer"))
+    healthy = FakeConnection(OK)
+    connections.extend([broken, healthy])
+
+    result = await backend._run_remote_command("true", safe=True)
+
+    assert result.stdout == "done\n"
+    assert broken.closed
+    assert not healthy.closed
+
+
+async def test_retry_keeps_connection_on_timeout(backend, connections, no_backoff):
+    conn = FakeConnection(asyncio.TimeoutError(), OK)
+    connections.append(conn)
+
+    await backend._run_remote_command("true", safe=True)
+
+    assert conn.commands == ["true", "true"]
+    assert not conn.closed
+
+
+async def test_retry_keeps_connection_on_failed_command(
+    backend, connections, no_backoff
+):
+    conn = FakeConnection(SlurmCommandError("slurmctld down"), OK)
+    connections.append(conn)
+
+    await backend.retry(lambda c: c.run("squeue"), "squeue")
+
+    assert not conn.closed
+
+
+async def test_retry_does_not_repeat_failed_login(backend, connections, no_backoff):
+    connections.extend([asyncssh.PermissionDenied("denied"), FakeConnection(OK)])
+
+    with pytest.raises(asyncssh.PermissionDenied):
+        await backend._run_remote_command("true", safe=True)
+
+    # Only a single login attempt was made
+    assert len(connections) == 1
+
+
+async def test_retry_raises_other_errors_immediately(backend, connections, no_backoff):
+    conn = FakeConnection(ValueError("bug"), OK)
+    connections.append(conn)
+
+    with pytest.raises(ValueError):
+        await backend._run_remote_command("true", safe=True)
+
+    assert conn.commands == ["true"]
+
+
+async def test_retry_gives_up(backend, connections, monkeypatch, no_backoff):
+    monkeypatch.setattr(slurm, "RETRY_ATTEMPTS", 3)
+    conn = FakeConnection(*[asyncio.TimeoutError()] * 3)
+    connections.append(conn)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await backend._run_remote_command("true", safe=True)
+
+    assert len(conn.commands) == 3
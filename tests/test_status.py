@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+from conftest import FakeConnection
+
+from prefect_slurm import SlurmJob, slurm
+from prefect_slurm.slurm import CLIBasedSlurmBackend, SlurmCommandError, SlurmJobStatus
+
+UNREACHABLE = (1, "", "slurm_load_jobs error: Unable to contact slurm controller")
+
+
+async def test_status_many_parses_squeue_rows(backend, connections):
+    conn = FakeConnection(
+        (0, "1 RUNNING 0\n2 PENDING 0\n3 CONFIGURING 0\n4_1 RUNNING 0\n\n", "")
+    )
+    connections.append(conn)
+
+    statuses = await backend.status_many([1, 2, 3, 4, 5])
+
+    assert conn.commands == [
+        "squeue --jobs=1,2,3,4,5 --Format=JobID,State,exit_code --noheader"
+    ]
+    # Unmapped states are UNKNOWN, array steps and missing jobs are omitted
+    assert statuses == {
+        1: SlurmJobStatus.RUNNING,
+        2: SlurmJobStatus.PENDING,
+        3: SlurmJobStatus.UNKNOWN,
+    }
+
+
+async def test_status_many_treats_invalid_job_id_as_missing(backend, connections):
+    conn = FakeConnection((1, "", "slurm_load_jobs error: Invalid job id specified"))
+    connections.append(conn)
+
+    assert await backend.status_many([1]) == {}
+
+
+async def test_status_many_retries_failed_squeue(backend, connections, no_backoff):
+    conn = FakeConnection(UNREACHABLE, (0, "1 RUNNING 0\n", ""))
+    connections.append(conn)
+
+    assert await backend.status_many([1]) == {1: SlurmJobStatus.RUNNING}
+    assert not conn.closed
+
+
+async def test_status_many_raises_if_squeue_keeps_failing(
+    backend, connections, monkeypatch, no_backoff
+):
+    monkeypatch.setattr(slurm, "RETRY_ATTEMPTS", 2)
+    connections.append(FakeConnection(UNREACHABLE, UNREACHABLE))
+
+    with pytest.raises(SlurmCommandError):
+        await backend.status_many([1, 2])
+
+
+async def test_status_many_only_job_state(connections):
+    backend = CLIBasedSlurmBackend("cluster", "user", "secret", only_job_state=True)
+    conn = FakeConnection((0, "", ""))
+    connections.append(conn)
+
+    await backend.status_many([1])
+
+    assert conn.commands[0].endswith(" --only-job-state")
+
+
+async def test_poller_batches_concurrent_requests(backend, connections, poller):
+    conn = FakeConnection((0, "1 RUNNING 0\n", ""))
+    connections.append(conn)
+
+    statuses = await asyncio.gather(backend.status(1), backend.status(2))
+
+    assert len(conn.commands) == 1
+    assert conn.commands[0].startswith("squeue --jobs=1,2 ")
+    # Jobs no longer in the queue are reported as UNDEFINED
+    assert statuses == [SlurmJobStatus.RUNNING, SlurmJobStatus.UNDEFINED]
+
+
+async def test_poller_reports_squeue_failures(
+    backend, connections, poller, monkeypatch, no_backoff
+):
+    monkeypatch.setattr(slurm, "RETRY_ATTEMPTS", 1)
+    connections.append(FakeConnection(UNREACHABLE))
+
+    results = await asyncio.gather(
+        backend.status(1), backend.status(2), return_exceptions=True
+    )
+
+    assert all(isinstance(result, SlurmCommandError) for result in results)
+
+
+async def test_poller_drops_cancelled_requests(backend, connections, poller):
+    conn = FakeConnection((0, "1 RUNNING 0\n", ""))
+    connections.append(conn)
+
+    task = asyncio.create_task(backend.status(1))
+    await asyncio.sleep(0)
+    task.cancel()
+    await backend.aclose()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await poller._task
+
+    # The closed backend did not reconnect to query the cancelled job
+    assert conn.commands == []
+    assert backend._conn is None
+
+
+async def test_poller_keeps_requests_shared_with_cancelled_callers(
+    backend, connections, poller
+):
+    conn = FakeConnection((0, "1 PENDING 0\n", ""))
+    connections.append(conn)
+
+    cancelled = asyncio.create_task(backend.status(1))
+    waiting = asyncio.create_task(poller.get(1, backend))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await waiting == SlurmJobStatus.PENDING
+    assert len(conn.commands) == 1
+
+
+async def test_status_is_cached_until_invalidated(backend, connections, poller):
+    conn = FakeConnection((0, "1 PENDING 0\n", ""), (0, "1 RUNNING 0\n", ""))
+    connections.append(conn)
+
+    assert await backend.status(1) == SlurmJobStatus.PENDING
+    assert await backend.status(1) == SlurmJobStatus.PENDING
+    assert len(conn.commands) == 1
+
+    backend.invalidate(1)
+
+    assert await backend.status(1) == SlurmJobStatus.RUNNING
+
+
+async def test_status_can_bypass_the_cache(backend, connections, poller):
+    conn = FakeConnection((0, "1 PENDING 0\n", ""), (0, "1 RUNNING 0\n", ""))
+    connections.append(conn)
+
+    assert await backend.status(1) == SlurmJobStatus.PENDING
+    assert await backend.status(1, use_cache=False) == SlurmJobStatus.RUNNING
+    # The fresh status replaces the cached one
+    assert await backend.status(1) == SlurmJobStatus.RUNNING
+    assert len(conn.commands) == 2
+
+
+async def test_watch_job_does_not_poll_the_cache(backend, connections, poller):
+    job = SlurmJob(min_polling_seconds=0, polling_jitter_seconds=0)
+    conn = FakeConnection(
+        (0, "1 PENDING 0\n", ""),
+        (0, "1 RUNNING 0\n", ""),
+        (1, "", "slurm_load_jobs error: Invalid job id specified"),
+        (0, "COMPLETED\n", ""),
+    )
+    connections.append(conn)
+    running = []
+
+    status_code = await job._watch_job(backend, 1, lambda: running.append(1))
+
+    assert status_code == 0
+    assert running == [1]
+    assert conn.commands[-1] == "sacct -j 1 -X -n -P -o State"